@@ -1003,6 +1003,7 @@ def applys_between(
 def truncated_graph_inputs(
     outputs: Sequence[Variable],
     ancestors_to_include: Optional[Collection[Variable]] = None,
+    exclude: Optional[Union[type, Tuple[type, ...]]] = None,
 ) -> list[Variable]:
     """Get the truncate graph inputs.
 
@@ -1019,6 +1020,8 @@ def truncated_graph_inputs(
         Variable to get conditions for
     ancestors_to_include : Optional[Collection[Variable]]
         Additional ancestors to assume, by default None
+    exclude : Optional[Union[type, Tuple[type, ...]]]
+        Variable types that are not returned, e.g. ``Constant``, by default None
 
     Returns
     -------
@@ -1082,6 +1085,8 @@ def truncated_graph_inputs(
     if not ancestors_to_include:  # None or empty
         # just filter out unique variables
         for variable in candidates:
+            if exclude is not None and isinstance(variable, exclude):
+                continue
             if variable not in truncated_inputs:
                 truncated_inputs.append(variable)
         # no more actions are needed
@@ -1107,7 +1112,8 @@ def truncated_graph_inputs(
             dependent = variable_depends_on(variable, ancestors_to_include - {variable})
             # ancestors to include that are present in the graph (not disconnected)
             # should be added to truncated_inputs
-            truncated_inputs.append(variable)
+            if exclude is None or not isinstance(variable, exclude):
+                truncated_inputs.append(variable)
             if dependent:
                 # if the ancestors to include is still dependent we need to go above, the search is not yet finished
                 # owner can never be None for a dependent variable
@@ -1125,7 +1131,7 @@ def truncated_graph_inputs(
                 # populate search if it's not an independent variable
                 # owner can never be None for a dependent variable
                 candidates.extend(n for n in variable.owner.inputs if n not in seen)
-            else:
+            elif exclude is None or not isinstance(variable, exclude):
                 # otherwise, do not search beyond
                 truncated_inputs.append(variable)
         # add variable to seen, no point in checking it once more
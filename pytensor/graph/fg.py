@@ -116,12 +116,53 @@ class FunctionGraph(MetaObject):
             outputs = [cast(Variable, _memo[o]) for o in outputs]
             inputs = [cast(Variable, _memo[i]) for i in inputs]
 
-        self.execute_callbacks_time: float = 0.0
-        self.execute_callbacks_times: Dict[Feature, float] = {}
-
         if features is None:
             features = []
 
+        self._setup_graph(inputs, outputs, [*features, ReplaceValidate()])
+        self.update_mapping = update_mapping
+
+    @classmethod
+    def _from_clone(
+        cls,
+        inputs: Sequence[Variable],
+        outputs: Sequence[Variable],
+        memo: Dict[Union[Apply, Variable, "Op"], Union[Apply, Variable, "Op"]],
+    ) -> "FunctionGraph":
+        """Create a `FunctionGraph` from a clone of a graph, without any `Feature`.
+
+        This is meant for short-lived graphs that are only used to perform
+        replacements, e.g. in `graph_replace`. Unlike the constructor, it does
+        not attach `ReplaceValidate`, so the replacements are neither
+        validated nor recorded in a history.
+
+        The graph is cloned with ``copy_inputs=False`` and ``copy_orphans=False``
+        and `memo` is filled with the clones, so `inputs` must be mapped to
+        owner-less variables in `memo`.
+
+        """
+        clone_get_equiv(
+            inputs, outputs, copy_inputs=False, copy_orphans=False, memo=memo
+        )
+        fg = cls.__new__(cls)
+        fg._setup_graph(
+            [cast(Variable, memo[i]) for i in inputs],
+            [cast(Variable, memo[o]) for o in outputs],
+            [],
+        )
+        fg.update_mapping = None
+        return fg
+
+    def _setup_graph(
+        self,
+        inputs: Sequence[Variable],
+        outputs: Sequence[Variable],
+        features: Sequence[Feature],
+    ) -> None:
+        """Initialize an empty graph and import everything between `inputs` and `outputs`."""
+        self.execute_callbacks_time: float = 0.0
+        self.execute_callbacks_times: Dict[Feature, float] = {}
+
         self._features: List[Feature] = []
 
         # All apply nodes in the subgraph defined by inputs and
@@ -140,8 +181,6 @@ class FunctionGraph(MetaObject):
         for f in features:
             self.attach_feature(f)
 
-        self.attach_feature(ReplaceValidate())
-
         for in_var in inputs:
             if in_var.owner is not None:
                 raise ValueError(
@@ -157,7 +196,6 @@ class FunctionGraph(MetaObject):
             self.add_output(output, reason="init")
 
         self.profile = None
-        self.update_mapping = update_mapping
 
     def add_output(
         self, var: Variable, reason: Optional[str] = None, import_missing: bool = False
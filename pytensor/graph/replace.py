@@ -1,7 +1,6 @@
-from functools import partial
 from typing import Iterable, Optional, Sequence, Union, cast, overload
 
-from pytensor.graph.basic import Apply, Constant, Variable, truncated_graph_inputs
+from pytensor.graph.basic import Constant, Variable, truncated_graph_inputs
 from pytensor.graph.fg import FunctionGraph
 
 
@@ -9,14 +8,22 @@ ReplaceTypes = Union[Iterable[tuple[Variable, Variable]], dict[Variable, Variabl
 
 
 def _format_replace(replace: Optional[ReplaceTypes] = None) -> dict[Variable, Variable]:
+    # check the common concrete types first, `Iterable` is an ABC and
+    # `isinstance` checks against it are comparatively slow
+    if replace is None:
+        return {}
+    replace_type = type(replace)
+    if replace_type is dict:
+        # PyLance has issues with type resolution
+        return cast(dict[Variable, Variable], replace)
+    if replace_type is list or replace_type is tuple:
+        return dict(cast(Iterable[tuple[Variable, Variable]], replace))
+
     items: dict[Variable, Variable]
     if isinstance(replace, dict):
-        # PyLance has issues with type resolution
         items = cast(dict[Variable, Variable], replace)
     elif isinstance(replace, Iterable):
         items = dict(replace)
-    elif replace is None:
-        items = {}
     else:
         raise ValueError(
             "replace is neither a dictionary, list, "
@@ -26,6 +33,30 @@ def _format_replace(replace: Optional[ReplaceTypes] = None) -> dict[Variable, Va
     return items
 
 
+def _sort_replacements(
+    fg: FunctionGraph, fg_replace: dict[Variable, Variable]
+) -> list[tuple[Variable, Variable]]:
+    """Order the replacements of ``fg`` in reverse topological order.
+
+    Variables without an owner have no position in the toposort, they go last.
+    """
+    owned: list[tuple[Variable, Variable]] = []
+    leaves: list[tuple[Variable, Variable]] = []
+    for pair in fg_replace.items():
+        if pair[0].owner is not None:
+            owned.append(pair)
+        else:
+            leaves.append(pair)
+    fg_vars = fg.variables
+    for key, _ in leaves:
+        if key not in fg_vars:
+            raise ValueError(f"{key} is not a part of graph")
+    if len(owned) > 1:
+        topo_index = {node: i for i, node in enumerate(fg.toposort())}
+        owned.sort(key=lambda pair: topo_index[pair[0].owner], reverse=True)
+    return owned + leaves
+
+
 @overload
 def clone_replace(
     output: Sequence[Variable],
@@ -68,13 +99,35 @@ def clone_replace(
     """
     from pytensor.compile.function.pfunc import rebuild_collect_shared
 
-    items = list(_format_replace(replace).items())
+    # this may be the caller's own dict, it must not be mutated
+    replace_dict = _format_replace(replace)
 
-    tmp_replace = [(x, x.type()) for x, y in items]
-    new_replace = [(x, y) for ((_, x), (_, y)) in zip(tmp_replace, items)]
-    _, _outs, _ = rebuild_collect_shared(output, [], tmp_replace, [], **rebuild_kwds)
+    if not replace_dict:
+        _, outs, _ = rebuild_collect_shared(output, [], [], [], **rebuild_kwds)
+        return outs
+
+    # The replacements are applied in two passes: the keys are first swapped
+    # for fresh placeholders, which are then swapped for the values. This
+    # makes the replacements simultaneous, so values may depend on keys
+    # (e.g. ``{x: x + 1}`` or ``{a: b + 1, b: c}``). When every value is a
+    # root variable that is not itself replaced, nothing can depend on a key
+    # and a single pass is equivalent, whatever `copy_inputs_over` is.
+    if all(
+        isinstance(y, Variable) and y.owner is None and y not in replace_dict
+        for y in replace_dict.values()
+    ):
+        _, outs, _ = rebuild_collect_shared(
+            output, [], replace_dict, [], **rebuild_kwds
+        )
+        return outs
 
-    # TODO Explain why we call it twice ?!
+    tmp_replace = [(x, x.type()) for x in replace_dict]
+    _, _outs, (clone_d, *_) = rebuild_collect_shared(
+        output, [], tmp_replace, [], **rebuild_kwds
+    )
+    # the placeholders themselves are cloned when `copy_inputs_over` is False,
+    # so the second pass has to replace the clones that ended up in `_outs`
+    new_replace = [(clone_d[x], y) for x, y in replace_dict.items()]
     _, outs, _ = rebuild_collect_shared(_outs, [], new_replace, [], **rebuild_kwds)
 
     return outs
@@ -134,65 +187,49 @@ def graph_replace(
         outputs = [outputs]
     else:
         as_list = True
+    # this may be the caller's own dict, it must not be mutated
     replace_dict = _format_replace(replace)
+    if not replace_dict:
+        # nothing to replace, the graph would be cloned and then mapped back
+        # onto the original variables
+        return list(outputs) if as_list else outputs[0]
     # collect minimum graph inputs which is required to compute outputs
     # and depend on replacements
     # additionally remove constants, they do not matter in clone get equiv
-    conditions = [
-        c
-        for c in truncated_graph_inputs(outputs, replace_dict)
-        if not isinstance(c, Constant)
-    ]
+    conditions = truncated_graph_inputs(outputs, replace_dict, exclude=Constant)
     # for the function graph we need the clean graph where
     # inputs do not have owners
     # this is exactly the reason to clone conditions
-    equiv = {c: c.clone(name=f"i-{i}") for i, c in enumerate(conditions)}
+    cloned_conditions = [c.clone(name=f"i-{i}") for i, c in enumerate(conditions)]
+    # `equiv` stays a regular dict keyed on the variables: it is the memo of
+    # `clone_get_equiv`, and some variables (e.g. `NominalVariable`) define
+    # their own equality, so it cannot be keyed on `id`
+    equiv = dict(zip(conditions, cloned_conditions))
     # some replace keys may disappear
     # the reason is they are outside the graph
     # clone the graph but preserve the equiv mapping
-    fg = FunctionGraph(
-        conditions,
-        outputs,
-        # clone_get_equiv kwargs
-        copy_orphans=False,
-        copy_inputs=False,
-        memo=equiv,
-    )
+    # the graph is discarded after the replacements, it needs no features
+    fg = FunctionGraph._from_clone(conditions, outputs, memo=equiv)
     # replace the conditions back
-    fg_replace = {equiv[c]: c for c in conditions}
+    fg_replace = dict(zip(cloned_conditions, conditions))
     # add the replacements on top of input mappings
-    fg_replace.update({equiv[r]: v for r, v in replace_dict.items() if r in equiv})
-    # replacements have to be done in reverse topological order so that nested
-    # expressions get recursively replaced correctly
-
     # some replacements may be initially outside the graph
     # but later introduced by a replacement
     # So far FunctionGraph does these replacements inplace it is thus unsafe
     # apply them using fg.replace, it may change the original graph
-    if strict:
-        non_fg_replace = {r: v for r, v in replace_dict.items() if r not in equiv}
-        if non_fg_replace:
-            raise ValueError(f"Some replacements were not used: {non_fg_replace}")
-    toposort = fg.toposort()
-
-    def toposort_key(
-        fg: FunctionGraph, ts: list[Apply], pair: tuple[Variable, Variable]
-    ) -> int:
-        key, _ = pair
-        if key.owner is not None:
-            return ts.index(key.owner)
+    non_fg_replace: dict[Variable, Variable] = {}
+    equiv_get = equiv.get
+    for r, v in replace_dict.items():
+        cloned = equiv_get(r)
+        if cloned is not None:
+            fg_replace[cloned] = v
         else:
-            if key in fg.variables:
-                return -1
-            else:
-                raise ValueError(f"{key} is not a part of graph")
-
-    sorted_replacements = sorted(
-        fg_replace.items(),
-        # sort based on the fg toposort, if a variable has no owner, it goes first
-        key=partial(toposort_key, fg, toposort),
-        reverse=True,
-    )
+            non_fg_replace[r] = v
+    if strict and non_fg_replace:
+        raise ValueError(f"Some replacements were not used: {non_fg_replace}")
+    # replacements have to be done in reverse topological order so that nested
+    # expressions get recursively replaced correctly
+    sorted_replacements = _sort_replacements(fg, fg_replace)
     fg.replace_all(sorted_replacements, import_missing=True)
     if as_list:
         return list(fg.outputs)
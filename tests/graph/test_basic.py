@@ -8,6 +8,7 @@ from pytensor import shared
 from pytensor import tensor as at
 from pytensor.graph.basic import (
     Apply,
+    Constant,
     NominalVariable,
     Variable,
     ancestors,
@@ -757,6 +758,17 @@ class TestTruncatedGraphInputs:
         # Disconnected output is present
         assert truncated_graph_inputs([o2, z], [y2]) == [z, y2]
 
+    def test_exclude(self):
+        x = vector("x")
+        c = at.constant(np.ones(3))
+        x2 = x + c
+        o = x2 * c
+
+        assert set(truncated_graph_inputs([o], [x])) == {c, x}
+        assert truncated_graph_inputs([o], [x], exclude=Constant) == [x]
+        assert truncated_graph_inputs([c], exclude=Constant) == []
+        assert truncated_graph_inputs([o], [c], exclude=Constant) == [x]
+
     def test_repeated_input(self):
         """Test that truncated_graph_inputs does not return repeated inputs."""
         x = MyVariable(1)
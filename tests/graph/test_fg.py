@@ -229,6 +229,21 @@ class TestFunctionGraph:
         assert var5.owner.inputs[1] is var1
         assert (var5.owner, 1) not in fg.get_clients(var2)
 
+    def test_from_clone(self):
+        var1 = MyVariable("var1")
+        var2 = MyVariable("var2")
+        var3 = op1(var2, var1)
+        var4 = op2(var3, var2)
+        memo = {var3: var3.clone(), var2: var2.clone()}
+        fg = FunctionGraph._from_clone([var3, var2], [var4], memo=memo)
+
+        assert fg._features == []
+        assert fg.inputs == [memo[var3], memo[var2]]
+        assert fg.outputs == [memo[var4]]
+        assert fg.apply_nodes == {memo[var4].owner}
+        # the original graph is left untouched
+        assert var4.owner.inputs == [var3, var2]
+
     @config.change_flags(compute_test_value="raise")
     def test_replace_test_value(self):
         var1 = MyVariable("var1")
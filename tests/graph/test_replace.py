@@ -1,9 +1,12 @@
+from unittest import mock
+
 import numpy as np
 import pytest
 
 import pytensor.tensor as pt
 from pytensor import config, function, shared
-from pytensor.graph.basic import graph_inputs
+from pytensor.graph.basic import Constant, equal_computations, graph_inputs
+from pytensor.graph.fg import FunctionGraph
 from pytensor.graph.replace import clone_replace, graph_replace
 from pytensor.tensor import dvector, fvector, vector
 from tests import unittest_tools as utt
@@ -134,6 +137,38 @@ class TestCloneReplace:
             test(x, pt.sum((x + 1) ** 2), mention_y=True), 1.21000003815
         )
 
+    def test_clone_replace_simultaneous(self):
+        a = vector("a")
+        b = vector("b")
+        c = vector("c")
+
+        out = clone_replace(a + b, replace={a: b + 1, b: c})
+        f = function([b, c], out)
+        utt.assert_allclose(f([1.0], [10.0]), [12.0])
+
+        # swapping inputs
+        out = clone_replace(a - b, replace={a: b, b: a})
+        f = function([a, b], out)
+        utt.assert_allclose(f([1.0], [10.0]), [9.0])
+
+    @pytest.mark.parametrize("copy_inputs_over", [True, False])
+    def test_clone_replace_root_and_nested_values(self, copy_inputs_over):
+        x = vector("x")
+        y = vector("y")
+        z = vector("z")
+
+        # a root value takes the single pass path, a nested one the two passes
+        root_out = clone_replace(x + y, {x: z}, copy_inputs_over=copy_inputs_over)
+        nested_out = clone_replace(x + y, {x: z + 1}, copy_inputs_over=copy_inputs_over)
+
+        for out in (root_out, nested_out):
+            inputs = [i for i in graph_inputs([out]) if not isinstance(i, Constant)]
+            assert sorted(i.name for i in inputs) == ["y", "z"]
+            if copy_inputs_over:
+                assert set(inputs) == {y, z}
+            else:
+                assert not {x, y, z} & set(inputs)
+
 
 class TestGraphReplace:
     def test_graph_replace(self):
@@ -223,3 +258,43 @@ class TestGraphReplace:
         assert oc[0] is o
         with pytest.raises(ValueError, match="Some replacements were not used"):
             oc = graph_replace([o], {fake: x.clone()}, strict=True)
+
+    @pytest.mark.parametrize("mutation", ["root", "replaced"])
+    def test_graph_replace_after_inplace_mutation(self, mutation):
+        x = vector("x")
+        y = vector("y")
+        w = vector("w")
+        z = vector("z")
+        o = x + y
+        graph_replace(o, {x: z})
+
+        # `FunctionGraph` mutates the graph of `o` in place
+        new_y = w * 2 if mutation == "root" else x * 2
+        FunctionGraph([x, y, w], [o], clone=False).replace(y, new_y)
+
+        oc = graph_replace(o, {x: z})
+        expected = z + w * 2 if mutation == "root" else z + z * 2
+        assert equal_computations([oc], [expected])
+
+    def test_graph_replace_leaves_skip_toposort(self):
+        x = MyVariable("x")
+        y = MyVariable("y")
+        x2 = MyOp("xop")(x)
+        o = MyOp("xyop")(x2, y)
+        new_x = x.clone(name="x_new")
+        new_y = y.clone(name="y_new")
+
+        with mock.patch.object(
+            FunctionGraph, "toposort", side_effect=AssertionError
+        ) as toposort:
+            # only root variables are replaced, there is nothing to order
+            oc = graph_replace(o, {x: new_x, y: new_y})
+            toposort.assert_not_called()
+            assert oc.owner.inputs[0].owner.inputs[0] is new_x
+            assert oc.owner.inputs[1] is new_y
+
+    def test_graph_replace_empty(self):
+        x = MyVariable("x")
+        o = MyOp("xop")(x)
+        assert graph_replace(o, {}) is o
+        assert graph_replace([o, x], None) == [o, x]
@@ -108,16 +108,16 @@ class RopLopChecker:
             self.rng.uniform(size=self.mat_in_shape), pytensor.config.floatX
         )
         yv = Rop(y, self.mx, self.mv)
-        rop_f = function([self.mx, self.mv], yv, on_unused_input="ignore")
         sy, _ = pytensor.scan(
             lambda i, y, x, v: (grad(y[i], x) * v).sum(),
             sequences=at.arange(y.shape[0]),
             non_sequences=[y, self.mx, self.mv],
         )
-        scan_f = function([self.mx, self.mv], sy, on_unused_input="ignore")
+        # Compile the operator and its reference in a single function, this
+        # halves the number of compilations
+        rop_f = function([self.mx, self.mv], [yv, sy], on_unused_input="ignore")
 
-        v1 = rop_f(vx, vv)
-        v2 = scan_f(vx, vv)
+        v1, v2 = rop_f(vx, vv)
 
         assert np.allclose(v1, v2), f"ROP mismatch: {v1} {v2}"
 
@@ -127,13 +127,10 @@ class RopLopChecker:
 
         vv = np.asarray(self.rng.uniform(size=out_shape), pytensor.config.floatX)
         yv = Lop(y, self.mx, self.v)
-        lop_f = function([self.mx, self.v], yv)
-
         sy = grad((self.v * y).sum(), self.mx)
-        scan_f = function([self.mx, self.v], sy)
+        lop_f = function([self.mx, self.v], [yv, sy])
 
-        v1 = lop_f(vx, vv)
-        v2 = scan_f(vx, vv)
+        v1, v2 = lop_f(vx, vv)
         assert np.allclose(v1, v2), f"LOP mismatch: {v1} {v2}"
 
     def check_rop_lop(self, y, out_shape):
@@ -145,19 +142,20 @@ class RopLopChecker:
         vx = np.asarray(self.rng.uniform(size=self.in_shape), pytensor.config.floatX)
         vv = np.asarray(self.rng.uniform(size=self.in_shape), pytensor.config.floatX)
 
-        yv = Rop(y, self.x, self.v)
-        rop_f = function([self.x, self.v], yv, on_unused_input="ignore")
+        # The Jacobian is used as reference for both the Rop and the Lop
         J, _ = pytensor.scan(
             lambda i, y, x: grad(y[i], x),
             sequences=at.arange(y.shape[0]),
             non_sequences=[y, self.x],
         )
-        sy = dot(J, self.v)
 
-        scan_f = function([self.x, self.v], sy, on_unused_input="ignore")
+        yv = Rop(y, self.x, self.v)
+        sy = dot(J, self.v)
+        # Compile the operator and its reference in a single function, this
+        # halves the number of compilations
+        rop_f = function([self.x, self.v], [yv, sy], on_unused_input="ignore")
 
-        v1 = rop_f(vx, vv)
-        v2 = scan_f(vx, vv)
+        v1, v2 = rop_f(vx, vv)
         assert np.allclose(v1, v2), f"ROP mismatch: {v1} {v2}"
 
         try:
@@ -176,18 +174,10 @@ class RopLopChecker:
         vv = np.asarray(self.rng.uniform(size=out_shape), pytensor.config.floatX)
 
         yv = Lop(y, self.x, self.v)
-        lop_f = function([self.x, self.v], yv, on_unused_input="ignore")
-        J, _ = pytensor.scan(
-            lambda i, y, x: grad(y[i], x),
-            sequences=at.arange(y.shape[0]),
-            non_sequences=[y, self.x],
-        )
         sy = dot(self.v, J)
+        lop_f = function([self.x, self.v], [yv, sy], on_unused_input="ignore")
 
-        scan_f = function([self.x, self.v], sy)
-
-        v1 = lop_f(vx, vv)
-        v2 = scan_f(vx, vv)
+        v1, v2 = lop_f(vx, vv)
         assert np.allclose(v1, v2), f"LOP mismatch: {v1} {v2}"
 
 